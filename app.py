@@ -0,0 +1,15 @@
+import streamlit as st
+
+from data import load_data
+
+# Entry point: `streamlit run app.py`. The pages/ scripts share load_data()'s cache.
+st.set_page_config(layout="wide")
+st.title("📦 Delivery Analytics")
+
+df = load_data()
+
+st.markdown(
+    f"Loaded **{len(df):,}** delivery lines for **{df['Customer Name'].nunique()}** dealers "
+    f"({df['Challan Date'].min():%d %b %Y} – {df['Challan Date'].max():%d %b %Y})."
+)
+st.markdown("Pick a page from the sidebar: **dashboard**, **summary** or **timeline**.")
@@ -0,0 +1,51 @@
+# ---------- PRODUCT CATEGORY MAPPING ----------
+CATEGORY_MAP = {
+    "Bio-Fertilizers": [
+        "peek sanjivani - consortia", "bio surakshak - tryka (trichoderma)",
+        "peek sanjivani - p (psb)", "sanjivani kit (5 ltrs)", "peek sanjivani - k (kmb)",
+        "peek sanjivani - p (azotobacter)", "bio surakshak - ryzia (metarhizium)",
+        "bio surakshak - rekha (psudomonas)", "peek sanjivani - n (azotobacter)",
+        "sanjivani granules", "rhizo-vishwa (200 gm)"
+    ],
+    "Micronutrients": [
+        "nutrisac kit - (50 kg)", "nutrisac kit - (25 kg)", "nutrisac kit - (10 kg)",
+        "dimond kit 50kg", "micromax kit (50 kg)", "ferrous sulphate (feso4) - 20 kg",
+        "nutrisac mg -20kg", "nutrisac fe - 10 kg", "nutrisac mg - 10 kg",
+        "nutrisac fe  - 20 kg", "jackpot kit", "orient kit - (50 kg)",
+        "magnesium sulphate (mgso4) - 20 kg", "orient kit - (53 kg)", "diamond kit 50kg",
+        "ferrous sulphate - feso4 (20 kg bag)"
+    ],
+    "Chelated Micronutrients": [
+        "iron man - eddha ferrous (500 gm)", "micro man - fe (500 gm)",
+        "micro man - fe (250 gm)", "micro man - zn (250 gm)", "micro man - zn (500 gm)",
+        "micro man - pro (1 ltr)", "micro man - pro (500 ml)", "micro man pro (250 ml)",
+        "iron man - eddha ferrous (1 kg)"
+    ],
+    "Bio-Stimulants": [
+        "titanic kit - (25 kg)", "jeeto - 95 (100 ml)", "jeeto - 95 (200 ml)",
+        "flora - 95 (100 ml)", "flora - 95 (200 ml)", "mantra humic acid (500 gm)",
+        "mantra humic acid (250 gm)", "mantra humic acid (1 kg)", "jeeto - 95 (400 ml)",
+        "pickup - 99 (100 ml)", "pickup - 99 (200 ml)", "pickup - 99 (400 ml)",
+        "micro man plus (250 gm)", "micro man plus (500 gm)", "flora - 95 (400 ml)",
+        "boomer - 90 (100 ml)", "boomer - 90 (200 ml)", "boomer - 90 (400 ml)",
+        "bingo 100 ml", "bingo 200 ml", "bingo 400 ml", "rainbow 200", "rainbow 400",
+        "rainbow 100ml", "mantra humic acid (100 gm)", "zumbaa", "turma max", "simba",
+        "captain (100 ml)", "ferrari (200 ml)", "ferrari (400 ml)", "bio stimulant - f",
+        "bio stimulant - j", "ozone power (10 kg bucket)", "fountain 1 liter",
+        "fountain 500 ml"
+    ],
+    "Other Bulk Orders": [
+        "biomass briquette", "nandi choona", "calcimag"
+    ]
+}
+ITEM_TO_CATEGORY = {item: cat for cat, items in CATEGORY_MAP.items() for item in items}
+
+# ---------- CHART COLORS ----------
+CATEGORY_COLORS = {
+    "Bio-Fertilizers": "#1f77b4",
+    "Micronutrients": "#ff7f0e",
+    "Chelated Micronutrients": "#2ca02c",
+    "Bio-Stimulants": "#d62728",
+    "Other Bulk Orders": "#9467bd",
+    "Uncategorized": "#8c564b"
+}
@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+from categories import ITEM_TO_CATEGORY
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_CSV = os.path.join(DATA_DIR, "Delivery_Challan (4).csv")
+DATA_PARQUET = os.path.join(DATA_DIR, "Delivery_Challan (4).parquet")
+# Only the columns the dashboards use; the export carries ~45
+DATA_COLUMNS = [
+    "Customer Name", "Item Name", "Item Total",
+    "Challan Date", "Delivery Challan Number", "QuantityOrdered",
+]
+DATA_CSV_CONVERT = pacsv.ConvertOptions(
+    include_columns=DATA_COLUMNS,
+    column_types={
+        "Item Total": pa.float64(),
+        "QuantityOrdered": pa.int64(),
+        # Parsed after loading with errors="coerce" so a malformed date becomes NaT
+        "Challan Date": pa.string(),
+    },
+    strings_can_be_null=True,
+)
+
+# ---------- LOAD DATA ----------
+def read_csv_data():
+    # Arrow's multithreaded CSV reader with the hot columns typed up front
+    table = pacsv.read_csv(DATA_CSV, convert_options=DATA_CSV_CONVERT)
+    df = table.to_pandas()
+    df['Challan Date'] = pd.to_datetime(df['Challan Date'], errors='coerce')
+    return df
+
+def read_source_data():
+    # The Parquet file is a local, untracked cache of the CSV's used columns. It is
+    # rebuilt whenever the CSV is newer, so replacing the CSV is enough to refresh it.
+    if os.path.exists(DATA_PARQUET) and os.path.getmtime(DATA_PARQUET) >= os.path.getmtime(DATA_CSV):
+        try:
+            return pd.read_parquet(DATA_PARQUET, columns=DATA_COLUMNS)
+        except (OSError, pa.ArrowInvalid):
+            pass  # unreadable cache: rebuild it from the CSV below
+
+    df = read_csv_data()
+    try:
+        # Written to a temp file and renamed so an interrupted write never leaves a
+        # partial cache behind at DATA_PARQUET
+        fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, prefix=".parquet-cache-", suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, DATA_PARQUET)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        pass  # read-only checkout: keep reading the CSV
+    return df
+
+# Shared by every page; st.cache_data is process-wide, so the file is read and
+# preprocessed once no matter which page is opened first. The CSV's mtime is part
+# of the key, so swapping the file in a running app reloads it.
+def data_version():
+    # Cheap cache key for anything derived from load_data()
+    return os.path.getmtime(DATA_CSV)
+
+def load_data():
+    return load_data_for(data_version())
+
+@st.cache_data(ttl=None, max_entries=1)
+def load_data_for(csv_mtime):
+    df = read_source_data()
+    df['Item Name'] = df['Item Name'].str.lower()
+    df['Customer Name'] = df['Customer Name'].str.strip()
+    df["Category"] = df["Item Name"].map(ITEM_TO_CATEGORY).fillna("Uncategorized").astype("category")
+    # Ordered categorical of "Mmm YY" labels; formats one label per month rather than per row,
+    # and Period categories sort chronologically so pivots need no column reordering
+    months = df["Challan Date"].dt.to_period("M").astype("category")
+    df["Month"] = pd.Categorical.from_codes(
+        months.cat.codes, [p.strftime("%b %y") for p in months.cat.categories], ordered=True
+    )
+    return df
+
+# ---------- CUSTOMER TYPE CLASSIFICATION ----------
+# Upper bounds are inclusive: > ₹10L Gold, > ₹5L Silver, > ₹1L Bronze, else Copper
+CUSTOMER_TYPE_EDGES = np.array([1_00_000, 5_00_000, 10_00_000])
+CUSTOMER_TYPE_LABELS = ["Copper", "Bronze", "Silver", "Gold"]
+
+def classify_customer_type(amounts):
+    # side="left" keeps an amount equal to an edge in the lower tier (strict ">" thresholds)
+    codes = np.searchsorted(CUSTOMER_TYPE_EDGES, np.asarray(amounts), side="left")
+    return pd.Categorical.from_codes(codes, CUSTOMER_TYPE_LABELS, ordered=True)
@@ -0,0 +1,101 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from categories import CATEGORY_COLORS
+from data import data_version, load_data
+
+# Must run before any other Streamlit call (cached loaders render a spinner)
+st.set_page_config(layout="wide")
+
+df = load_data()
+df_version = data_version()
+
+# Dealer stats; keyed on df_version so the frame itself is never hashed
+@st.cache_data(max_entries=1)
+def build_dealer_stats(_df, df_version):
+    dealer_stats = _df.groupby("Customer Name", observed=True).agg({
+        "Item Total": "sum",
+        "Delivery Challan Number": pd.Series.nunique
+    }).rename(columns={"Item Total": "Total Sales", "Delivery Challan Number": "Total Orders"}).reset_index()
+
+    dealer_stats = dealer_stats.sort_values(by="Total Sales", ascending=False).reset_index(drop=True)
+    # Lowercased once here so the search box doesn't re-lower every name per keystroke
+    dealer_stats["_name_lc"] = dealer_stats["Customer Name"].str.lower()
+    return dealer_stats
+
+dealer_stats = build_dealer_stats(df, df_version)
+
+# Category share (%) per dealer, one row per customer
+@st.cache_data(max_entries=1)
+def build_category_share(_df, df_version):
+    amt = _df.pivot_table(index="Customer Name", columns="Category", values="Item Total", aggfunc="sum", fill_value=0, observed=True)
+    return amt.div(amt.sum(axis=1), axis=0).mul(100).round(1)
+
+category_share = build_category_share(df, df_version)
+
+# Streamlit layout
+st.title("📦 Dealer Dashboard")
+
+# Search bar
+search = st.text_input("🔍 Search Dealer by Name").strip().lower()
+filtered_dealers = dealer_stats[dealer_stats["_name_lc"].str.contains(search, regex=False)]
+
+if filtered_dealers.empty:
+    st.warning("No dealers found.")
+else:
+    # One table for every matching dealer; the breakdown bars render client-side
+    dealer_table = pd.DataFrame({
+        "Serial": filtered_dealers.index + 1,
+        "Customer": filtered_dealers["Customer Name"],
+        "Orders": filtered_dealers["Total Orders"],
+        "Category Breakdown": category_share.loc[filtered_dealers["Customer Name"]].to_numpy().tolist(),
+        "Total Sales": filtered_dealers["Total Sales"],
+    })
+    st.dataframe(
+        dealer_table,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Category Breakdown": st.column_config.BarChartColumn(
+                help="% of sales by category: " + ", ".join(category_share.columns),
+                y_min=0,
+                y_max=100,
+            ),
+            "Total Sales": st.column_config.NumberColumn(format="₹%.2f"),
+        },
+    )
+
+    # Monthly breakdown chart for a single dealer
+    customer = st.selectbox("📊 Inspect dealer", filtered_dealers["Customer Name"])
+    customer_data = df[df["Customer Name"] == customer]
+
+    monthly_sales = (
+        customer_data.groupby(["Month", "Category"], observed=True)["Item Total"]
+        .sum().reset_index()
+    )
+    monthly_totals = (
+        customer_data.groupby("Month", observed=True)["Item Total"]
+        .sum().reset_index()
+    )
+
+    fig = px.bar(
+        monthly_sales,
+        x="Month",
+        y="Item Total",
+        color="Category",
+        title=f"Monthly Sales by Category – {customer}",
+        text_auto=".2s",
+        color_discrete_map=CATEGORY_COLORS,
+        # "Mmm YY" labels aren't parsed as dates; pin the axis to the chronological category order
+        category_orders={"Month": list(df["Month"].cat.categories)}
+    )
+    for month, month_total in monthly_totals[["Month", "Item Total"]].itertuples(index=False, name=None):
+        fig.add_annotation(
+            x=month,
+            y=month_total,
+            text=f"₹{month_total:,.0f}",
+            showarrow=False,
+            yshift=10
+        )
+    st.plotly_chart(fig, use_container_width=True)
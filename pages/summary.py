@@ -0,0 +1,115 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from categories import CATEGORY_MAP
+from data import classify_customer_type, data_version, load_data
+
+# Must run before any other Streamlit call (cached loaders render a spinner)
+st.set_page_config(layout="wide")
+
+df = load_data()
+df_version = data_version()
+
+# ---------- AGGREGATION ----------
+category_list = list(CATEGORY_MAP.keys()) + ["Uncategorized"]
+
+# Keyed on df_version so the frame itself is never hashed
+@st.cache_data(max_entries=1)
+def build_summary(_df, df_version, category_list):
+    summary = _df.groupby("Customer Name", observed=True).agg({
+        "Delivery Challan Number": pd.Series.nunique,
+        "Item Total": "sum"
+    }).rename(columns={
+        "Delivery Challan Number": "Total Orders",
+        "Item Total": "Total Order Amount"
+    })
+
+    # Add per-category ₹ + % columns (one pivot instead of a groupby per category)
+    amt = _df.pivot_table(
+        index="Customer Name", columns="Category", values="Item Total", aggfunc="sum", fill_value=0, observed=True
+    ).reindex(index=summary.index, columns=category_list, fill_value=0)
+    total_amt = summary["Total Order Amount"].replace(0, 1)
+    pct = amt.div(total_amt, axis=0) * 100
+
+    cat_fmt = (amt.map("₹{:,.0f}".format) + " " + pct.map("({:.1f}%)".format)).where(amt > 0, "-")
+    summary = summary.join(cat_fmt)
+
+    # Selectbox options, sorted once here rather than on every rerun
+    customer_names = ("All", *sorted(summary.index.unique()))
+
+    # Numeric sidecar (same row order as summary) so totals never re-parse the display strings
+    return summary.reset_index(), amt.reset_index(drop=True), customer_names
+
+summary, summary_num, customer_names = build_summary(df, df_version, category_list)
+
+# ---------- CUSTOMER TYPE CLASSIFICATION ----------
+summary["Customer Type"] = classify_customer_type(summary["Total Order Amount"])
+
+# ---------- STREAMLIT UI ----------
+st.title("📊 Dealer Summary Table")
+
+types = ["All", "Gold", "Silver", "Bronze", "Copper"]
+selected_type = st.selectbox("🏅 Filter by Customer Type", types)
+
+selected_customer = st.selectbox("🔍 Search or Select Customer", customer_names)
+
+# ---------- FILTERING ----------
+mask = np.ones(len(summary), dtype=bool)
+if selected_type != "All":
+    mask &= (summary["Customer Type"] == selected_type).to_numpy()
+if selected_customer != "All":
+    mask &= (summary["Customer Name"] == selected_customer).to_numpy()
+filtered = summary[mask]
+
+# ---------- DISPLAY FILTERED SUMMARY FIRST ----------
+def highlight_row(row):
+    color_map = {
+        "Gold": "#FFFACD",
+        "Silver": "#D3D3D3",
+        "Bronze": "#F5DEB3",
+        "Copper": "#ADD8E6"
+    }
+    return ['background-color: {}'.format(color_map.get(row["Customer Type"], "#FFFFFF"))] * len(row)
+
+format_dict = {
+    "Total Order Amount": "₹{:,.2f}"
+}
+
+styled = filtered.style.apply(highlight_row, axis=1).format(format_dict)
+st.markdown("### 📋 Filtered Dealer Summary")
+st.dataframe(styled, use_container_width=True)
+
+# ---------- TOTALS ROW ----------
+if not filtered.empty:
+    total_amt = filtered["Total Order Amount"].sum()
+    total_orders = filtered["Total Orders"].sum()
+    row = {
+        "Customer Name": "Total",
+        "Total Orders": total_orders,
+        "Total Order Amount": total_amt,
+        "Customer Type": "-"
+    }
+
+    filtered_num = summary_num.loc[filtered.index]
+    for cat in category_list:
+        total_cat_amt = filtered_num[cat].sum()
+        pct = (total_cat_amt / total_amt * 100) if total_amt else 0
+        row[cat] = f"₹{total_cat_amt:,.0f} ({pct:.1f}%)" if total_cat_amt > 0 else "-"
+
+    total_df = pd.DataFrame([row])
+    st.markdown("### 🔢 Totals for Filtered Results")
+    st.dataframe(total_df.style.format(format_dict), use_container_width=True)
+
+# ---------- CUSTOMER TYPE SUMMARY (AT THE END) ----------
+st.markdown("### 📊 Summary by Customer Type")
+type_summary = summary.groupby("Customer Type", observed=True).agg(
+    **{
+        "No. of Customers": ("Customer Name", "nunique"),
+        "Total No. of Orders": ("Total Orders", "sum"),
+        "Total Amount of Order": ("Total Order Amount", "sum")
+    }
+).reset_index()
+
+type_summary["Total Amount of Order"] = type_summary["Total Amount of Order"].apply(lambda x: f"₹{x:,.2f}")
+st.dataframe(type_summary, use_container_width=True)
@@ -0,0 +1,152 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from data import classify_customer_type, data_version, load_data
+
+# Must run before any other Streamlit call (cached loaders render a spinner)
+st.set_page_config(layout="wide")
+
+df = load_data()
+df_version = data_version()
+
+# ---------- CUSTOMER TYPE CLASSIFICATION ----------
+# Returns df with Customer Type attached; keyed on df_version so neither the hash
+# of the frame nor the merge is repeated on a rerun
+@st.cache_data(max_entries=1)
+def attach_customer_type(_df, df_version):
+    customer_summary = _df.groupby("Customer Name", observed=True)["Item Total"].sum().reset_index()
+    customer_summary["Customer Type"] = classify_customer_type(customer_summary["Item Total"])
+    return _df.merge(customer_summary[["Customer Name", "Customer Type"]], on="Customer Name", how="left")
+
+df = attach_customer_type(df, df_version)
+
+# ---------- STREAMLIT UI ----------
+st.title("📦 Product Quantity Timeline")
+
+# Filters
+product_types = sorted(df["Category"].unique())
+customer_types = sorted(df["Customer Type"].dropna().unique())
+
+col1, col2 = st.columns(2)
+with col1:
+    selected_product_type = st.selectbox("📂 Filter by Product Category", ["All"] + product_types)
+with col2:
+    selected_customer_type = st.selectbox("🏅 Filter by Customer Type", ["All"] + customer_types)
+
+search_term = st.text_input("🔍 Search Product Name", "").strip().lower()
+
+# ---------- APPLY FILTERS ----------
+# One boolean mask, one slice: no full copy of df before filtering
+def filter_mask(df, selected_product_type, selected_customer_type, search_term):
+    mask = np.ones(len(df), dtype=bool)
+    if selected_product_type != "All":
+        # Categorical == compares integer codes
+        mask &= (df["Category"] == selected_product_type).to_numpy()
+    if selected_customer_type != "All":
+        mask &= (df["Customer Type"] == selected_customer_type).to_numpy()
+    if search_term:
+        mask &= df["Item Name"].str.contains(search_term, case=False, na=False).to_numpy()
+    return mask
+
+filters = (selected_product_type, selected_customer_type, search_term)
+
+# ---------- QUANTITY PIVOT TABLE ----------
+# Keyed on (data version, filters) like the heatmaps below, rather than hashing the
+# filtered frame on every rerun; bounded because the search term is free text
+@st.cache_data(max_entries=32, ttl=3600)
+def build_pivot_qty(_df, df_version, filters):
+    filtered_df = _df[filter_mask(_df, *filters)]
+    pivot_qty = filtered_df.groupby(["Category", "Item Name", "Month"], observed=True)["QuantityOrdered"].sum().unstack(fill_value=0)
+    pivot_qty["Total Qty"] = pivot_qty.sum(axis=1)
+
+    # ---------- ADD ITEM COST COLUMN ----------
+    item_total = filtered_df.groupby("Item Name", observed=True)["Item Total"].sum()
+    pivot_qty = pivot_qty.join(item_total.rename("Total Cost"), on="Item Name")
+    return pivot_qty
+
+pivot_qty = build_pivot_qty(df, df_version, filters)
+
+# ---------- COLOR ROWS BY CATEGORY ----------
+def highlight_by_category(row):
+    category_colors = {
+        "Bio-Fertilizers": "#E8F8F5",
+        "Micronutrients": "#FEF9E7",
+        "Chelated Micronutrients": "#FDEDEC",
+        "Bio-Stimulants": "#EBF5FB",
+        "Other Bulk Orders": "#F9EBEA",
+        "Uncategorized": "#F4F6F6"
+    }
+    color = category_colors.get(row.name[0], "#FFFFFF")
+    return [f"background-color: {color}"] * len(row)
+
+# ---------- DISPLAY TABLE ----------
+st.markdown("### 📊 Quantity Ordered by Month")
+# Zeros render as blanks via the Styler; the frame itself stays numeric
+month_cols = pivot_qty.columns.difference(["Total Qty", "Total Cost"])
+styled = (
+    pivot_qty.style.apply(highlight_by_category, axis=1)
+    .format(lambda v: "" if v == 0 else str(v), subset=month_cols)
+    .format("₹{:,.0f}", subset=["Total Cost"])
+)
+st.dataframe(styled, use_container_width=True)
+
+# ---------- SUMMARY TOTALS ----------
+st.markdown("### 📈 Totals for All Filtered Items")
+summary = pivot_qty.drop(columns=["Total Qty", "Total Cost"], errors="ignore").sum().to_frame().T
+summary["Total Qty"] = pivot_qty["Total Qty"].sum()
+summary["Total Cost"] = f"₹{pivot_qty['Total Cost'].sum():,.0f}"
+st.dataframe(summary, use_container_width=True)
+
+# ---------- HEATMAPS BY CUSTOMER TYPE ----------
+st.markdown("## 🔥 Product Heatmaps by Customer Type")
+
+# Cached per (data version, filters[, customer type]). The search box is free text, so
+# entries are capped and expire. _df is not hashed (leading underscore); df_version
+# stands in for it in the key.
+@st.cache_data(max_entries=32, ttl=3600)
+def build_heatmap_data(_df, df_version, filters):
+    mask = filter_mask(_df, *filters) & (_df["Category"] != "Other Bulk Orders").to_numpy()
+    heatmap_data = _df[mask]
+
+    return heatmap_data.assign(**{"Item Name": heatmap_data["Item Name"].fillna("Unknown Item")})
+
+@st.cache_data(max_entries=128, ttl=3600)
+def make_heatmap(_df, df_version, filters, customer_type):
+    heatmap_data = build_heatmap_data(_df, df_version, filters)
+    sub_df = heatmap_data[heatmap_data["Customer Type"] == customer_type]
+    if sub_df.empty:
+        return None
+
+    pivot = sub_df.pivot_table(index="Item Name", columns="Month", values="QuantityOrdered", aggfunc="sum", fill_value=0, observed=True)
+    pivot = pivot.loc[pivot.sum(axis=1) > 0]
+
+    # Mask 0s to show white
+    z_data = pivot.values
+    colorscale = [[0, 'white'], [0.00001, 'lightblue'], [1, 'darkblue']]
+
+    fig = go.Figure(data=go.Heatmap(
+        z=z_data,
+        x=pivot.columns,
+        y=pivot.index,
+        colorscale="YlGnBu",
+        zmin=0.00001,
+        zauto=True,
+        hovertemplate="Product: %{y}<br>Month: %{x}<br>Qty: %{z}<extra></extra>",
+        colorbar=dict(title="Qty Ordered")
+    ))
+
+    fig.update_layout(
+        title=f"🔥 {customer_type} Customers - Quantity Ordered",
+        xaxis_title="Month",
+        yaxis_title="Item Name",
+        height=600,
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+    return fig
+
+for customer_type in ["Gold", "Silver", "Bronze", "Copper"]:
+    fig = make_heatmap(df, df_version, filters, customer_type)
+    if fig is None:
+        continue
+    st.plotly_chart(fig, use_container_width=True)